@@ -1,154 +1,528 @@
 import os
+import io
+import atexit
+import gzip
+import json
 import pickle
+import queue
 import time
+import functools
+import threading
 import requests
-import xml.etree.ElementTree as ET
 import socket
 import sys
 import logging
+import logging.handlers
 import backoff
+import httplib2
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
-from typing import List, Dict, Any, Set
+from urllib3.util.retry import Retry
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import List, Dict, Any, Set, Iterator, Optional, Tuple
 
 ### Install the following packages in PyCharm terminal:
-### pip install google-auth-oauthlib google-auth google-api-python-client requests backoff
+### pip install google-auth-oauthlib google-auth "google-api-python-client>=2.0" requests "backoff>=2.0" lxml
+from google.auth.transport.requests import AuthorizedSession, Request
+from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from googleapiclient.discovery import DISCOVERY_URI, build, build_from_document
+from googleapiclient.errors import HttpError, UnknownApiNameOrVersion
+from lxml import etree
 
 
 # Logging configuration
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler("google_indexing.log"),
-        logging.StreamHandler(sys.stdout),
-    ],
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+_log_file_handler = logging.FileHandler("google_indexing.log")
+_log_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+_log_stream_handler = logging.StreamHandler(sys.stdout)
+_log_stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+# Records are queued by whichever thread logs them and written by a
+# background listener, so log I/O never blocks API calls or sitemap parsing
+_log_queue = queue.Queue(-1)
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Merge arguments and tracebacks into the message without the LOG_FORMAT
+# prefix, which the listener's handlers add
+_log_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    # Buffer file writes; flushed every 256 records, on errors and at exit
+    logging.handlers.MemoryHandler(
+        capacity=256, flushLevel=logging.ERROR, target=_log_file_handler
+    ),
+    _log_stream_handler,
+    respect_handler_level=True,
 )
+_log_listener.start()
+# Drain queued records before logging flushes and closes its handlers
+atexit.register(_log_listener.stop)
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
 logger = logging.getLogger(__name__)
 
+# Number of processed URLs between progress log lines
+PROGRESS_LOG_INTERVAL = 20
+
+# Maximum number of publish calls the Indexing API accepts in one batch request
+BATCH_SIZE = 100
+# Maximum number of batch requests in flight at the same time
+MAX_WORKERS = 8
+# Read size used when streaming sitemap bodies into the parser
+STREAM_CHUNK_SIZE = 64 * 1024
+# Leading bytes of gzip-compressed files
+GZIP_MAGIC = b"\x1f\x8b"
+# Maximum number of sub-sitemaps fetched at the same time
+SITEMAP_WORKERS = 8
+# Retries for sitemap requests failing with a connection error or these statuses
+SITEMAP_MAX_RETRIES = 3
+SITEMAP_RETRY_STATUSES = (429, 502, 503, 504)
+# Indexing API quota of publish calls per minute
+PUBLISH_RPM = 600
+# Sustained publish calls per second
+PUBLISH_RATE = PUBLISH_RPM / 60
+# Batch round-trip time above which the publish rate is reduced (seconds)
+BATCH_TARGET_LATENCY = 5.0
+# Maximum number of times a rate-limited URL is re-queued into a later batch
+BATCH_MAX_RETRIES = 3
+
+# Sitemap protocol element tags in Clark notation, built once for the parser
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+_LOC_TAG = f"{{{SITEMAP_NS}}}loc"
+_SITEMAP_TAG = f"{{{SITEMAP_NS}}}sitemap"
+
+# Wait used for rate-limited batch calls without a Retry-After header
+DEFAULT_RETRY_AFTER = 60
+# Discovery document cached when no bundled copy is available
+DISCOVERY_CACHE_FILE = "indexing_v3_discovery.json"
+DISCOVERY_CACHE_TTL = 30 * 24 * 60 * 60
+# Attempts per API request on timeouts, rate limits and server errors
+RETRY_MAX_TRIES = 5
+
+
+def _retry_after_seconds(e: Exception) -> Optional[int]:
+    """Return the Retry-After delay of an HTTP error in seconds, if present."""
+    if not isinstance(e, HttpError):
+        return None
+    try:
+        return int(e.resp.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_after_expo(max_value: int = DEFAULT_RETRY_AFTER):
+    """
+    Wait generator that honors Retry-After headers of HTTP errors.
+
+    Falls back to jittered exponential backoff when the header is missing.
+    """
+    expo = backoff.expo(max_value=max_value)
+    next(expo)
+    exception = yield
+    while True:
+        delay = _retry_after_seconds(exception)
+        if delay is None:
+            delay = backoff.full_jitter(next(expo))
+        exception = yield delay
+
+
+def _is_permanent_error(e: Exception) -> bool:
+    """Return True for HTTP client errors that retrying cannot fix."""
+    return (
+        isinstance(e, HttpError)
+        and e.resp.status < 500
+        and e.resp.status not in (408, 429)
+    )
+
+
+# Retry transient network/API errors (timeouts, rate limits, 5xx), waiting
+# for Retry-After when provided and jittered exponential backoff otherwise
+retry_on_transient_errors = backoff.on_exception(
+    retry_after_expo,
+    (HttpError, socket.error, OSError, ConnectionError),
+    max_tries=RETRY_MAX_TRIES,
+    max_time=300,
+    jitter=None,
+    giveup=_is_permanent_error,
+)
+
+
+class IndexingError(Exception):
+    """Raised when a URL could not be registered or deleted in the index"""
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter"""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize TokenBucket class
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1):
+        """
+        Take tokens from the bucket, sleeping only if not enough are available.
+
+        Requests larger than the capacity are allowed and wait until the
+        deficit has been refilled.
+
+        Args:
+            tokens: Number of tokens to take
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    def set_rate(self, rate: float):
+        """
+        Change the refill rate, keeping tokens refilled so far.
+
+        Args:
+            rate: New number of tokens added per second
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self.rate = rate
+
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Take tokens from the bucket without sleeping.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            float: Seconds to wait before the tokens may be used
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            return -self._tokens / self.rate if self._tokens < 0 else 0
+
+
+class Backpressure:
+    """Thread-safe AIMD control of a token bucket's refill rate"""
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        target_latency: float,
+        min_rate: float = 1.0,
+        alpha: float = 1.0,
+        beta: float = 0.5,
+        window: int = 8,
+    ):
+        """
+        Initialize Backpressure class
+
+        Args:
+            bucket: Token bucket pacing the requests; its rate is the upper bound
+            target_latency: Mean latency above which the rate is reduced
+            min_rate: Lower bound of the rate in tokens per second
+            alpha: Tokens per second added after a healthy response
+            beta: Factor applied to the rate on congestion
+            window: Number of recent latencies averaged
+        """
+        self.bucket = bucket
+        self.target_latency = target_latency
+        self.max_rate = bucket.rate
+        self.min_rate = min(min_rate, bucket.rate)
+        self.alpha = alpha
+        self.beta = beta
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, congested: bool = False):
+        """
+        Adjust the bucket rate after a request.
+
+        The rate grows additively while the mean latency stays on target
+        and shrinks multiplicatively on slow or throttled responses.
+
+        Args:
+            latency: Request round-trip time in seconds
+            congested: Whether the request was rate limited or failed
+        """
+        with self._lock:
+            self._latencies.append(latency)
+            mean_latency = sum(self._latencies) / len(self._latencies)
+            rate = self.bucket.rate
+            if congested or mean_latency > self.target_latency:
+                rate = max(self.min_rate, rate * self.beta)
+            else:
+                rate = min(self.max_rate, rate + self.alpha)
+            self.bucket.set_rate(rate)
+
+
+class AuthorizedSessionHttp:
+    """httplib2-compatible transport backed by a pooled AuthorizedSession"""
+
+    def __init__(self, session: AuthorizedSession, timeout: int = 60):
+        """
+        Initialize AuthorizedSessionHttp class
+
+        Args:
+            session: Authorized requests session used for all API calls
+            timeout: Request timeout in seconds
+        """
+        self.session = session
+        self.timeout = timeout
+
+    def request(
+        self,
+        uri,
+        method="GET",
+        body=None,
+        headers=None,
+        redirections=None,
+        connection_type=None,
+    ):
+        """Send a request the way googleapiclient expects from httplib2.Http."""
+        response = self.session.request(
+            method, uri, data=body, headers=headers, timeout=self.timeout
+        )
+        info = dict(response.headers)
+        info["status"] = str(response.status_code)
+        resp = httplib2.Response(info)
+        resp.reason = response.reason
+        return resp, response.content
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+
 
 class GoogleIndexingAPI:
     """Class for handling Google Search Indexing API"""
 
-    def __init__(self, client_secret_file: str, index_type: int = 1):
+    def __init__(
+        self,
+        client_secret_file: str,
+        index_type: int = 1,
+        max_workers: int = MAX_WORKERS,
+    ):
         """
         Initialize GoogleIndexingAPI class
 
         Args:
             client_secret_file: Google API client secret file path
             index_type: Index type (0: delete index, 1: register index)
+            max_workers: Maximum number of batch requests in flight at once
         """
         self.client_secret_file = client_secret_file
         self.index_type = index_type  # 0: delete index / 1: register index
+        # Notification type sent with every publish call
+        self._type_string = "URL_DELETED" if index_type == 0 else "URL_UPDATED"
+        self.max_workers = max(1, max_workers)
         self.work_dir = "./"
         self.scopes = ["https://www.googleapis.com/auth/indexing"]
-        self.token_file_path = os.path.join(self.work_dir, "auto_token.pickle")
+        self.token_file_path = os.path.join(self.work_dir, "auto_token.json")
         self.service = None
+        self._session = None
         self.success_count = 0
         self.error_count = 0
+        self.failed_urls: List[Tuple[str, str]] = []
+        self._count_lock = threading.Lock()
+        self._bucket = TokenBucket(rate=PUBLISH_RATE, capacity=BATCH_SIZE)
+        # Slow the bucket down on throttled or slow batches, and back up to
+        # PUBLISH_RATE while batches are healthy
+        self._backpressure = Backpressure(self._bucket, BATCH_TARGET_LATENCY)
+        # Send times of publish calls in the last minute
+        self._request_times = deque()
+        self._window_lock = threading.Lock()
 
     def authenticate(self) -> bool:
         """
         Perform Google API authentication and initialize service.
 
+        A cached token is reused (and refreshed if expired) when available;
+        the browser flow only runs when no usable token exists.
+
         Returns:
             bool: Authentication success status
         """
         try:
             logger.info("Starting Google API authentication...")
 
-            # Delete existing token file (for fresh authentication)
-            if os.path.exists(self.token_file_path):
-                os.remove(self.token_file_path)
-                logger.info("Deleted existing token file.")
+            creds = self._load_cached_credentials()
+            if creds is None:
+                creds = self._authorize_in_browser()
+                if creds is None:
+                    return False
 
-            # Set OAUTHLIB_INSECURE_TRANSPORT (for local development)
-            os.environ["OAUTHLIB_INSECURE_TRANSPORT"] = "1"
+            # Save token
+            with open(self.token_file_path, "w", encoding="utf-8") as token:
+                token.write(creds.to_json())
+            logger.info("Authentication token saved to file.")
 
-            # Configure authentication flow
-            flow = InstalledAppFlow.from_client_secrets_file(
-                self.client_secret_file, scopes=self.scopes
+            # Initialize service on a pooled keep-alive session, keeping one
+            # connection per concurrent batch request so none is discarded
+            self._session = AuthorizedSession(creds)
+            self._session.mount(
+                "https://",
+                HTTPAdapter(pool_maxsize=self.max_workers, max_retries=0),
             )
-
-            print("=" * 80)
-            print("Starting Google OAuth authentication.")
-            print("Your browser will open automatically shortly.")
-            print(
-                "Please log in with your Google account and authorize the application."
+            self.service = self._build_service(AuthorizedSessionHttp(self._session))
+            logger.info(
+                "Google API authentication and service initialization completed"
             )
-            print("=" * 80)
+            return True
 
-            # Try multiple ports
-            ports_to_try = [3000, 8080, 8081, 8082, 0]  # 0 = auto-find available port
+        except Exception as e:
+            logger.error(f"Error occurred during authentication: {e}")
+            return False
 
-            for port in ports_to_try:
-                try:
-                    logger.info(f"Attempting to start local server on port {port}...")
+    def _build_service(self, http):
+        """
+        Build the Indexing API client.
 
-                    if port == 0:
-                        # Auto-find available port
-                        creds = flow.run_local_server(
-                            port=0, access_type="offline", prompt="consent"
-                        )
-                    else:
-                        # Use specific port
-                        creds = flow.run_local_server(
-                            port=port, access_type="offline", prompt="consent"
-                        )
+        The discovery document bundled with googleapiclient is used when
+        available; otherwise a copy cached on disk for up to
+        DISCOVERY_CACHE_TTL seconds, fetched over the network if needed.
 
-                    logger.info("Authentication completed successfully!")
-                    break
+        Args:
+            http: HTTP transport for API requests
 
-                except OSError as e:
-                    if "Address already in use" in str(e) or "WinError 10048" in str(e):
-                        logger.warning(
-                            f"Port {port} is already in use. Trying another port..."
-                        )
-                        continue
-                    else:
-                        logger.error(f"Error on port {port}: {e}")
-                        continue
-                except Exception as e:
-                    logger.error(f"Authentication failed on port {port}: {e}")
-                    continue
-            else:
-                # Failed on all ports
-                logger.error("Authentication failed on all ports.")
-                logger.error(
-                    "Please verify the following redirect URIs are configured in Google Cloud Console:"
+        Returns:
+            Resource: Indexing API service object
+        """
+        try:
+            return build(
+                "indexing",
+                "v3",
+                http=http,
+                static_discovery=True,
+                cache_discovery=False,
+            )
+        except UnknownApiNameOrVersion:
+            logger.info("Bundled discovery document not found, using cached copy.")
+            return build_from_document(self._load_discovery_document(), http=http)
+
+    def _load_discovery_document(self) -> str:
+        """Return the Indexing API discovery document from disk or network."""
+        cache_path = os.path.join(self.work_dir, DISCOVERY_CACHE_FILE)
+        if (
+            os.path.exists(cache_path)
+            and time.time() - os.path.getmtime(cache_path) < DISCOVERY_CACHE_TTL
+        ):
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return f.read()
+
+        logger.info("Fetching Indexing API discovery document...")
+        response = self._session.get(
+            DISCOVERY_URI.format(api="indexing", apiVersion="v3"), timeout=30
+        )
+        response.raise_for_status()
+        with open(cache_path, "w", encoding="utf-8") as f:
+            f.write(response.text)
+        return response.text
+
+    def _load_cached_credentials(self) -> Optional[Credentials]:
+        """
+        Load cached credentials from the token file, refreshing them if expired.
+
+        Returns:
+            Credentials: Valid credentials, or None if authorization is required
+        """
+        if not os.path.exists(self.token_file_path):
+            return None
+
+        try:
+            with open(self.token_file_path, "r", encoding="utf-8") as token:
+                creds = Credentials.from_authorized_user_info(
+                    json.load(token), self.scopes
                 )
-                logger.error("- http://localhost:3000")
-                logger.error("- http://localhost:8080")
-                logger.error("- http://localhost:8081")
-                logger.error("- http://localhost:8082")
-                return False
+        except Exception as e:
+            logger.warning(f"Could not load cached token: {e}")
+            return None
 
-            # Save token
-            with open(self.token_file_path, "wb") as token:
-                pickle.dump(creds, token)
-            logger.info("Authentication token saved to file.")
+        if not creds or not creds.has_scopes(self.scopes):
+            return None
 
-            # Initialize service
-            self.service = build("indexing", "v3", credentials=creds)
-            logger.info(
-                "Google API authentication and service initialization completed"
-            )
-            return True
+        if creds.valid:
+            logger.info("Using cached authentication token.")
+            return creds
+
+        if creds.expired and creds.refresh_token:
+            try:
+                creds.refresh(Request())
+                logger.info("Refreshed cached authentication token.")
+                return creds
+            except Exception as e:
+                logger.warning(f"Could not refresh cached token: {e}")
+
+        return None
+
+    def _authorize_in_browser(self) -> Optional[Credentials]:
+        """
+        Run the browser-based OAuth flow on a local server.
+
+        Returns:
+            Credentials: Authorized credentials, or None if authorization failed
+        """
+        # Set OAUTHLIB_INSECURE_TRANSPORT (for local development)
+        os.environ["OAUTHLIB_INSECURE_TRANSPORT"] = "1"
+
+        # Configure authentication flow
+        flow = InstalledAppFlow.from_client_secrets_file(
+            self.client_secret_file, scopes=self.scopes
+        )
 
+        print("=" * 80)
+        print("Starting Google OAuth authentication.")
+        print("Your browser will open automatically shortly.")
+        print("Please log in with your Google account and authorize the application.")
+        print("=" * 80)
+
+        # Let the OS pick a free port for the local redirect server
+        try:
+            logger.info("Starting local server for OAuth redirect...")
+            creds = flow.run_local_server(
+                port=0, access_type="offline", prompt="consent"
+            )
+            logger.info("Authentication completed successfully!")
+            return creds
         except Exception as e:
-            logger.error(f"Error occurred during authentication: {e}")
-            return False
+            logger.error(f"Authentication failed: {e}")
+            logger.error(
+                "Please verify http://localhost is configured as a redirect URI in Google Cloud Console."
+            )
+            return None
+
+    def _record_success(self):
+        """Count a successful publish call from any worker thread."""
+        with self._count_lock:
+            self.success_count += 1
+
+    def _record_failure(self, url: str, message: str):
+        """Count a failed URL and keep its error message for the summary."""
+        with self._count_lock:
+            self.error_count += 1
+            self.failed_urls.append((url, message))
+
+    def close(self):
+        """Release pooled HTTP connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
-    @backoff.on_exception(
-        backoff.expo,
-        (HttpError, socket.error, OSError, ConnectionError),
-        max_tries=3,
-        giveup=lambda e: isinstance(e, HttpError)
-        and e.resp.status >= 400
-        and e.resp.status != 429,
-    )
     def notify_url_updated(self, url: str) -> Dict[str, Any]:
         """
         Request to register or delete URL in Google Search index.
@@ -158,101 +532,585 @@ class GoogleIndexingAPI:
 
         Returns:
             Dict: API response result
+
+        Raises:
+            IndexingError: If the request failed after retries
         """
         if not self.service:
-            logger.error(
+            raise IndexingError(
                 "API service is not initialized. Please call authenticate() method first."
             )
-            return {"error": "Service not initialized"}
 
         try:
-            index_type = "URL_DELETED" if self.index_type == 0 else "URL_UPDATED"
-            body = {"url": url, "type": index_type}
-            response = self.service.urlNotifications().publish(body=body).execute()
-            self.success_count += 1
+            body = {"url": url, "type": self._type_string}
+            # Wait for quota before sending to prevent API rate limiting
+            self._bucket.acquire()
+            self.wait_if_throttled()
+            response = self._publish(body)
+            self._record_success()
             return response
         except HttpError as e:
-            if e.resp.status == 429:  # Rate limit exceeded
-                logger.warning(
-                    f"API rate limit exceeded. Waiting 60 seconds before retry."
-                )
-                time.sleep(60)
-                return self.notify_url_updated(url)
-            elif e.resp.status >= 400:
-                logger.error(f"API error ({e.resp.status}): {e}")
-                self.error_count += 1
-                return {"error": f"HTTP Error {e.resp.status}: {str(e)}"}
+            logger.error("API error (%s): %s", e.resp.status, e)
+            message = f"HTTP Error {e.resp.status}: {str(e)}"
         except (socket.error, OSError) as e:
-            logger.error(f"Network error: {e}. Retrying...")
+            logger.error("Network error: %s", e)
+            message = str(e)
+        except Exception as e:
+            logger.error("Unexpected error: %s", e)
+            message = str(e)
+
+        self._record_failure(url, message)
+        raise IndexingError(message)
+
+    def notify_urls_batch(
+        self, urls: List[str]
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Request to register or delete multiple URLs using batch HTTP requests.
+
+        Up to BATCH_SIZE publish calls are sent in a single HTTP request.
+        Rate-limited calls are re-queued into the next batch. Only
+        successful calls are yielded; failed URLs are counted and kept in
+        `failed_urls`.
+
+        Args:
+            urls: URLs to register/delete in index
+
+        Yields:
+            Tuple[str, Dict]: URL and its API response result
+
+        Raises:
+            IndexingError: If the API service is not initialized
+        """
+        if not self.service:
+            raise IndexingError(
+                "API service is not initialized. Please call authenticate() method first."
+            )
+
+        pending = list(urls)
+        attempts: Dict[str, int] = {}
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while pending:
+                in_flight: Set[Future] = set()
+                rate_limited: List[Tuple[str, Optional[int]]] = []
+                for start in range(0, len(pending), BATCH_SIZE):
+                    chunk = pending[start : start + BATCH_SIZE]
+                    # Wait for quota before sending to prevent API rate
+                    # limiting, handing out batches that finish meanwhile so
+                    # accepted URLs reach the caller without waiting for the
+                    # rest of the round to be submitted
+                    deadline = time.monotonic() + self._bucket.reserve(len(chunk))
+                    while True:
+                        yield from self._finished_results(in_flight, rate_limited)
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        if in_flight:
+                            wait(
+                                in_flight,
+                                timeout=remaining,
+                                return_when=FIRST_COMPLETED,
+                            )
+                        else:
+                            time.sleep(remaining)
+                    self.wait_if_throttled(len(chunk))
+                    in_flight.add(executor.submit(self._publish_batch, chunk))
+
+                while in_flight:
+                    wait(in_flight, return_when=FIRST_COMPLETED)
+                    yield from self._finished_results(in_flight, rate_limited)
+
+                # Re-queue rate-limited URLs into the next round of batches
+                pending = []
+                retry_after = None
+                for url, delay in rate_limited:
+                    if delay is not None:
+                        retry_after = max(retry_after or 0, delay)
+                    attempts[url] = attempts.get(url, 0) + 1
+                    if attempts[url] > BATCH_MAX_RETRIES:
+                        logger.error("Rate limit retries exhausted for %s", url)
+                        self._record_failure(url, "Rate limit retries exhausted")
+                    else:
+                        pending.append(url)
+
+                if pending:
+                    if retry_after is None:
+                        retry_after = DEFAULT_RETRY_AFTER
+                    logger.warning(
+                        "API rate limit exceeded for %d URLs. Waiting %s seconds before retry.",
+                        len(rate_limited),
+                        retry_after,
+                    )
+                    time.sleep(retry_after)
+        except BaseException:
+            # Interrupted or closed early: return to the caller right away so
+            # it can save progress instead of waiting for in-flight batches
+            executor.shutdown(wait=False, cancel_futures=True)
             raise
+        else:
+            executor.shutdown()
+
+    @staticmethod
+    def _finished_results(
+        in_flight: Set[Future], rate_limited: List[Tuple[str, Optional[int]]]
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield results of finished batches and remove them from `in_flight`.
+
+        Args:
+            in_flight: Futures of submitted batches; updated in place
+            rate_limited: Receives (URL, Retry-After) pairs of finished batches
+
+        Yields:
+            Tuple[str, Dict]: URL and its API response result
+        """
+        done = {future for future in in_flight if future.done()}
+        in_flight -= done
+        for future in done:
+            results, limited = future.result()
+            rate_limited.extend(limited)
+            yield from results
+
+    def wait_if_throttled(self, calls: int = 1, rpm: int = PUBLISH_RPM):
+        """
+        Sleep until `calls` more publish calls fit in the per-minute quota.
+
+        Send times are kept for a sliding 60 second window, so bursts
+        allowed by the token bucket can never exceed `rpm` in any minute.
+
+        Args:
+            calls: Number of publish calls about to be sent
+            rpm: Maximum number of publish calls per minute
+        """
+        calls = min(calls, rpm)
+        with self._window_lock:
+            while True:
+                now = time.monotonic()
+                while self._request_times and self._request_times[0] <= now - 60:
+                    self._request_times.popleft()
+
+                excess = len(self._request_times) + calls - rpm
+                if excess <= 0:
+                    break
+                # Wait until enough of the oldest calls leave the window
+                time.sleep(self._request_times[excess - 1] + 60 - now)
+
+            self._request_times.extend([now] * calls)
+
+    def _publish_batch(
+        self, chunk: List[str]
+    ) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[Tuple[str, Optional[int]]]]:
+        """
+        Send one batch request for up to BATCH_SIZE URLs.
+
+        Args:
+            chunk: URLs to include in the batch
+
+        Returns:
+            Tuple: (URL, response) successful results in chunk order and
+                (URL, Retry-After) pairs for rate-limited URLs
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        rate_limited: List[Tuple[str, Optional[int]]] = []
+
+        batch = self.service.new_batch_http_request(
+            callback=functools.partial(self._batch_cb, chunk, results, rate_limited)
+        )
+        for idx, url in enumerate(chunk):
+            body = {"url": url, "type": self._type_string}
+            batch.add(
+                self.service.urlNotifications().publish(body=body),
+                request_id=str(idx),
+            )
+
+        started = time.monotonic()
+        congested = True
+        try:
+            self._execute_batch(batch)
+            congested = bool(rate_limited)
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            self.error_count += 1
-            return {"error": str(e)}
+            logger.error("Batch request failed: %s", e)
+            for url in chunk:
+                self._record_failure(url, str(e))
+            return [], []
+        finally:
+            self._backpressure.record(time.monotonic() - started, congested)
+
+        ordered = [
+            (url, results[str(idx)])
+            for idx, url in enumerate(chunk)
+            if str(idx) in results
+        ]
+        return ordered, rate_limited
+
+    @retry_on_transient_errors
+    def _publish(self, body: Dict[str, str]) -> Dict[str, Any]:
+        """Send a single publish call, retrying on transient errors."""
+        return self.service.urlNotifications().publish(body=body).execute()
+
+    @retry_on_transient_errors
+    def _execute_batch(self, batch) -> None:
+        """Execute a batch request, retrying on transient errors."""
+        batch.execute()
+
+    def _batch_cb(
+        self,
+        chunk: List[str],
+        results: Dict[str, Dict[str, Any]],
+        rate_limited: List[Tuple[str, Optional[int]]],
+        request_id: str,
+        response: Dict[str, Any],
+        exception: Exception,
+    ):
+        """Collect the result of a single publish call within a batch."""
+        url = chunk[int(request_id)]
+        if exception is None:
+            self._record_success()
+            results[request_id] = response
+        elif isinstance(exception, HttpError) and exception.resp.status in (429, 503):
+            rate_limited.append((url, _retry_after_seconds(exception)))
+        elif isinstance(exception, HttpError):
+            logger.error(
+                "API error (%s) for %s: %s", exception.resp.status, url, exception
+            )
+            self._record_failure(
+                url, f"HTTP Error {exception.resp.status}: {str(exception)}"
+            )
+        else:
+            logger.error("Unexpected error for %s: %s", url, exception)
+            self._record_failure(url, str(exception))
 
 
 class SitemapProcessor:
     """Class for processing sitemaps and extracting URLs"""
 
-    def __init__(self, sitemap_url: str):
+    def __init__(
+        self,
+        sitemap_url: str,
+        session: Optional[requests.Session] = None,
+        cache_file: Optional[str] = None,
+    ):
         """
         Initialize SitemapProcessor class
 
         Args:
             sitemap_url: Sitemap URL to process
+            session: HTTP session reused for all sitemap requests
+            cache_file: File caching unchanged sitemaps between runs (None to disable)
         """
         self.sitemap_url = sitemap_url
+        self.session = session if session is not None else self.create_session()
+        self.cache_file = cache_file
+        self._cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._cache_dirty = False
+        self._cache_lock = threading.Lock()
+
+    @staticmethod
+    def create_session() -> requests.Session:
+        """
+        Create an HTTP session for fetching sitemaps.
 
-    def extract_urls(self) -> List[str]:
+        Connections are kept alive and pooled, with one connection per
+        concurrent sub-sitemap fetch, so TCP and TLS setup is shared across
+        a whole sitemap index. Transient failures are retried with
+        exponential backoff.
+        """
+        session = requests.Session()
+        session.headers.update({"Accept-Encoding": "gzip", "Connection": "keep-alive"})
+        adapter = HTTPAdapter(
+            pool_maxsize=SITEMAP_WORKERS,
+            max_retries=Retry(
+                total=SITEMAP_MAX_RETRIES,
+                backoff_factor=0.5,
+                status_forcelist=SITEMAP_RETRY_STATUSES,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def extract_urls(self) -> Iterator[str]:
         """
-        Extract URL list from sitemap.
+        Extract URLs from sitemap.
+
+        Sitemaps are streamed and parsed incrementally, so only the element
+        currently being processed is kept in memory. Sub-sitemaps of a
+        sitemap index are walked from a worklist; upcoming siblings are
+        fetched in the background, up to SITEMAP_WORKERS ahead of the
+        consumer, and held in memory until consumed. Closing the generator
+        stops the walk: fetches not yet started are cancelled and only
+        those in flight are finished.
+
+        With a cache file, the page URLs of each sitemap are also kept
+        while it is read, and every sitemap read to the end is cached. On
+        later runs those that are unchanged (HTTP 304) are served from the
+        cache instead of being downloaded and parsed again. A sitemap the
+        consumer stops reading early is not cached, so a run that stops at
+        the daily limit only caches the sitemaps it finished; once every
+        URL is processed, runs read the whole tree and cache all of it.
+        Entries for sitemaps no longer listed are dropped after a full
+        walk.
+
+        Yields:
+            str: Extracted URL
+        """
+        self._load_cache()
+        urls = self._walk_sitemaps()
+        try:
+            yield from urls
+        finally:
+            urls.close()
+            self._save_cache()
+
+    def _load_cache(self):
+        """Load cached sitemap validators and URLs from the cache file."""
+        if self.cache_file is None or self._cache is not None:
+            return
+        self._cache = {}
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, "rb") as f:
+                    self._cache = pickle.load(f)
+            except Exception as e:
+                logger.warning(f"Could not load sitemap cache: {e}")
+
+    def _save_cache(self):
+        """Write the sitemap cache if any entry changed."""
+        if self.cache_file is None or not self._cache_dirty:
+            return
+        try:
+            temp_file = f"{self.cache_file}.tmp"
+            with open(temp_file, "wb") as f:
+                pickle.dump(self._cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.cache_file)
+            self._cache_dirty = False
+        except Exception as e:
+            logger.error(f"Error saving sitemap cache: {e}")
+
+    def _store_cache(
+        self,
+        sitemap_url: str,
+        response: requests.Response,
+        urls: List[str],
+        sub_sitemaps: List[str],
+    ):
+        """Cache a fully parsed sitemap under its ETag/Last-Modified validators."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._cache_lock:
+            if etag or last_modified:
+                self._cache[sitemap_url] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "urls": urls,
+                    "sub_sitemaps": sub_sitemaps,
+                }
+                self._cache_dirty = True
+            elif self._cache.pop(sitemap_url, None) is not None:
+                self._cache_dirty = True
+
+    def _prune_cache(self, visited: Set[str]):
+        """Drop cached sitemaps that are not in `visited`."""
+        if self._cache is None:
+            return
+        with self._cache_lock:
+            for sitemap_url in [url for url in self._cache if url not in visited]:
+                del self._cache[sitemap_url]
+                self._cache_dirty = True
+
+    def _walk_sitemaps(self) -> Iterator[str]:
+        """Stream page URLs from the sitemap and all of its sub-sitemaps."""
+        worklist = deque([self.sitemap_url])
+        # Sitemaps already queued, so indexes listing each other are not
+        # fetched again
+        visited = {self.sitemap_url}
+
+        # Sibling sub-sitemaps fetched ahead of the consumer, by URL. The
+        # look-ahead starts at one sitemap and doubles with every sitemap
+        # consumed, so a consumer that stops early leaves little unused work
+        prefetched: Dict[str, Future] = {}
+        depth = 1
+
+        executor = ThreadPoolExecutor(max_workers=SITEMAP_WORKERS)
+        try:
+            while worklist:
+                sitemap_url = worklist.popleft()
+                for loc in islice(worklist, depth):
+                    if loc not in prefetched:
+                        prefetched[loc] = executor.submit(self._fetch_sitemap, loc)
+
+                sub_sitemaps = []
+                future = prefetched.pop(sitemap_url, None)
+                if future is None:
+                    # Stream the sitemap directly when it was not fetched ahead
+                    yield from self._iter_sitemap(sitemap_url, sub_sitemaps)
+                else:
+                    urls, subs = future.result()
+                    yield from urls
+                    sub_sitemaps.extend(subs)
+                depth = min(depth * 2, SITEMAP_WORKERS)
+
+                # Process sub-sitemaps next, keeping document order
+                worklist.extendleft(reversed(self._unvisited(sub_sitemaps, visited)))
+
+            # The whole sitemap tree was walked, so cached sitemaps it no
+            # longer lists are stale
+            self._prune_cache(visited)
+        finally:
+            # Drop fetches that have not started when the consumer stops
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _unvisited(sub_sitemaps: List[str], visited: Set[str]) -> List[str]:
+        """
+        Return sub-sitemaps that have not been queued yet, marking them visited.
+
+        Args:
+            sub_sitemaps: Sub-sitemap URLs found in a sitemap index
+            visited: Sitemap URLs already queued; updated in place
 
         Returns:
-            List[str]: List of extracted URLs
+            List[str]: New sub-sitemap URLs in document order
         """
+        new_sitemaps = []
+        for loc in sub_sitemaps:
+            if loc in visited:
+                logger.warning("Skipping already visited sitemap: %s", loc)
+                continue
+            visited.add(loc)
+            new_sitemaps.append(loc)
+        return new_sitemaps
+
+    def _fetch_sitemap(self, sitemap_url: str) -> Tuple[List[str], List[str]]:
+        """
+        Fetch and parse a single sitemap.
+
+        Args:
+            sitemap_url: Sitemap URL to fetch
+
+        Returns:
+            Tuple: Page URLs and sub-sitemap URLs found in the sitemap
+        """
+        sub_sitemaps: List[str] = []
+        urls = list(self._iter_sitemap(sitemap_url, sub_sitemaps))
+        return urls, sub_sitemaps
+
+    @staticmethod
+    def _open_stream(response: requests.Response):
+        """
+        Return a file-like object streaming the decoded sitemap body.
+
+        Content-Encoding is decoded by urllib3; gzip-compressed sitemap
+        files (e.g. sitemap.xml.gz) are decompressed on the fly.
+        """
+        response.raw.decode_content = True
+        # Keep the raw stream readable after the body is exhausted, so the
+        # buffered reader can still drain what it has already read
+        response.raw.auto_close = False
+        stream = io.BufferedReader(response.raw, buffer_size=STREAM_CHUNK_SIZE)
+        if stream.peek(2)[:2] == GZIP_MAGIC:
+            return gzip.GzipFile(fileobj=stream)
+        return stream
+
+    def _iter_sitemap(self, sitemap_url: str, sub_sitemaps: List[str]) -> Iterator[str]:
+        """
+        Stream page URLs from a single sitemap.
+
+        With a cache file, a sitemap that is read to the end is cached; one
+        the consumer stops reading early is not.
+
+        Args:
+            sitemap_url: Sitemap URL to fetch
+            sub_sitemaps: Receives sub-sitemap URLs if the sitemap is an index
+
+        Yields:
+            str: Extracted URL
+        """
+        url_count = 0
+        index_entries = []
+        cached = self._cache.get(sitemap_url) if self._cache is not None else None
+
+        # Ask the server to skip the body if the sitemap is unchanged
+        headers = {}
+        if cached is not None:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
         try:
-            logger.info(f"Fetching data from sitemap URL: {self.sitemap_url}")
-            response = requests.get(self.sitemap_url, timeout=30)
-            response.raise_for_status()
-
-            # Parse XML
-            root = ET.fromstring(response.content)
-
-            # Handle XML namespaces
-            namespaces = {"ns": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-
-            # Extract URLs
-            urls = []
-            # Handle regular sitemap format
-            for url_element in root.findall(".//ns:url", namespaces):
-                loc_element = url_element.find("ns:loc", namespaces)
-                if loc_element is not None and loc_element.text:
-                    urls.append(loc_element.text)
-
-            # Handle sitemap index format
-            if not urls:
-                for sitemap_element in root.findall(".//ns:sitemap", namespaces):
-                    loc_element = sitemap_element.find("ns:loc", namespaces)
-                    if loc_element is not None and loc_element.text:
-                        logger.info(
-                            f"Sub-sitemap found: {loc_element.text}, processing..."
+            logger.info("Fetching data from sitemap URL: %s", sitemap_url)
+            with self.session.get(
+                sitemap_url, stream=True, timeout=30, headers=headers
+            ) as response:
+                if cached is not None and response.status_code == 304:
+                    logger.info("Sitemap not modified, using cached URLs.")
+                    url_count = len(cached["urls"])
+                    index_entries = list(cached["sub_sitemaps"])
+                    yield from cached["urls"]
+                else:
+                    response.raise_for_status()
+                    # Page URLs are only kept when they will be cached
+                    page_urls = [] if self._cache is not None else None
+                    is_index = None
+                    # Parse XML incrementally; the tag filter runs in libxml2 so
+                    # only <loc> elements reach Python. Sitemaps are untrusted
+                    # input, so entities are not expanded and the parser never
+                    # fetches anything itself
+                    for _, elem in etree.iterparse(
+                        self._open_stream(response),
+                        events=("end",),
+                        tag=_LOC_TAG,
+                        resolve_entities=False,
+                        no_network=True,
+                    ):
+                        parent = elem.getparent()
+                        if is_index is None:
+                            # A sitemap is either an index or a urlset, so the
+                            # format only needs to be checked on the first <loc>
+                            is_index = parent.tag == _SITEMAP_TAG
+
+                        if elem.text:
+                            # Handle sitemap index format
+                            if is_index:
+                                index_entries.append(elem.text)
+                            # Handle regular sitemap format
+                            else:
+                                url_count += 1
+                                if page_urls is not None:
+                                    page_urls.append(elem.text)
+                                yield elem.text
+
+                        # Release processed elements
+                        elem.clear(keep_tail=True)
+                        while parent.getprevious() is not None:
+                            del parent.getparent()[0]
+
+                    # Only a sitemap that was read to the end is cached
+                    if page_urls is not None:
+                        self._store_cache(
+                            sitemap_url, response, page_urls, index_entries
                         )
-                        sub_processor = SitemapProcessor(loc_element.text)
-                        urls.extend(sub_processor.extract_urls())
-
-            logger.info(f"Extracted {len(urls)} URLs from sitemap.")
-            return urls
 
         except RequestException as e:
             logger.error(f"Network error occurred while accessing sitemap: {e}")
-            return []
-        except ET.ParseError as e:
+            return
+        except etree.XMLSyntaxError as e:
             logger.error(f"XML parsing error: {e}")
             logger.error("Please check if the sitemap format is correct.")
-            return []
+            return
         except Exception as e:
             logger.error(f"Error occurred while extracting URLs from sitemap: {e}")
-            return []
+            return
+
+        logger.info("Extracted %d URLs from sitemap.", url_count)
+
+        if not url_count:
+            for loc in index_entries:
+                logger.info("Sub-sitemap found: %s", loc)
+            sub_sitemaps.extend(index_entries)
 
 
 class IndexingManager:
@@ -265,6 +1123,7 @@ class IndexingManager:
         index_type: int = 1,
         daily_limit: int = 200,
         start_offset: int = 0,
+        max_workers: int = MAX_WORKERS,
     ):
         """
         Initialize IndexingManager class
@@ -275,44 +1134,134 @@ class IndexingManager:
             index_type: Index type (0: delete index, 1: register index)
             daily_limit: Daily processing limit
             start_offset: Number of URLs to skip from the beginning
+            max_workers: Maximum number of batch requests in flight at once
         """
         self.sitemap_url = sitemap_url
         self.client_secret_file = client_secret_file
         self.index_type = index_type
         self.daily_limit = daily_limit
         self.start_offset = start_offset
-        self.sitemap_processor = SitemapProcessor(sitemap_url)
-        self.indexing_api = GoogleIndexingAPI(client_secret_file, index_type)
+        self.http_session = SitemapProcessor.create_session()
+        self.sitemap_processor = SitemapProcessor(
+            sitemap_url, session=self.http_session, cache_file="sitemap_cache.pkl"
+        )
+        self.indexing_api = GoogleIndexingAPI(
+            client_secret_file, index_type, max_workers=max_workers
+        )
         self.processed_urls = set()
-        self.processed_urls_file = "processed_urls.txt"
+        self.processed_urls_file = "processed_urls.pkl"
+        # Text file written by earlier versions, migrated on first load
+        self.legacy_processed_urls_file = "processed_urls.txt"
+        # URLs processed since the last snapshot, appended one per line
+        self.journal_file = "processed_urls.jsonl"
+        self._journal = None
+        self.total_urls = 0
 
     def load_processed_urls(self):
-        """Load previously processed URLs from file."""
+        """Load previously processed URLs from the snapshot and journal."""
+        migrated = False
         if os.path.exists(self.processed_urls_file):
             try:
-                with open(self.processed_urls_file, "r", encoding="utf-8") as f:
+                with open(self.processed_urls_file, "rb") as f:
+                    self.processed_urls = pickle.load(f)
+                logger.info(
+                    f"Loaded {len(self.processed_urls)} previously processed URLs."
+                )
+            except Exception as e:
+                logger.error(f"Error loading processed URLs: {e}")
+                self.processed_urls = set()
+        elif os.path.exists(self.legacy_processed_urls_file):
+            try:
+                with open(self.legacy_processed_urls_file, "r", encoding="utf-8") as f:
                     self.processed_urls = set(
                         line.strip() for line in f if line.strip()
                     )
                 logger.info(
-                    f"Loaded {len(self.processed_urls)} previously processed URLs."
+                    f"Loaded {len(self.processed_urls)} previously processed URLs "
+                    f"from {self.legacy_processed_urls_file}."
                 )
+                migrated = True
             except Exception as e:
                 logger.error(f"Error loading processed URLs: {e}")
                 self.processed_urls = set()
         else:
             logger.info("No previous processed URLs file found. Starting fresh.")
 
+        self._replay_journal()
+        if migrated:
+            self.save_processed_urls()
+
+    def _replay_journal(self):
+        """Add URLs recorded in the journal since the last snapshot."""
+        if not os.path.exists(self.journal_file):
+            return
+        count = 0
+        try:
+            with open(self.journal_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self.processed_urls.add(json.loads(line))
+                        count += 1
+                    except ValueError:
+                        # Line cut short by an interrupted write
+                        continue
+            if count:
+                logger.info(f"Recovered {count} processed URLs from journal.")
+        except Exception as e:
+            logger.error(f"Error reading processed URLs journal: {e}")
+
+    def mark_processed(self, url: str):
+        """Record a processed URL and append it to the journal."""
+        self.processed_urls.add(url)
+        try:
+            if self._journal is None:
+                # Line buffered, so each URL reaches the file when written
+                self._journal = open(
+                    self.journal_file, "a", encoding="utf-8", buffering=1
+                )
+            self._journal.write(json.dumps(url) + "\n")
+        except Exception as e:
+            logger.error(f"Error writing processed URLs journal: {e}")
+
+    def _close_journal(self):
+        """Close the journal file if it is open."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
     def save_processed_urls(self):
-        """Save processed URLs to file."""
+        """Write a snapshot of all processed URLs and truncate the journal."""
+        self._close_journal()
         try:
-            with open(self.processed_urls_file, "w", encoding="utf-8") as f:
-                for url in sorted(self.processed_urls):
-                    f.write(f"{url}\n")
+            temp_file = f"{self.processed_urls_file}.tmp"
+            with open(temp_file, "wb") as f:
+                pickle.dump(self.processed_urls, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.processed_urls_file)
+            # Every journaled URL is now in the snapshot
+            open(self.journal_file, "w").close()
             logger.info(f"Saved {len(self.processed_urls)} processed URLs to file.")
         except Exception as e:
             logger.error(f"Error saving processed URLs: {e}")
 
+    def _iter_remaining_urls(self) -> Iterator[str]:
+        """
+        Stream sitemap URLs that have not been processed yet.
+
+        Duplicate sitemap entries are yielded only once, so each URL uses
+        at most one slot of the daily quota.
+
+        Yields:
+            str: Unique, not yet processed URL
+        """
+        seen = set()
+        for url in self.sitemap_processor.extract_urls():
+            if url in seen:
+                continue
+            seen.add(url)
+            self.total_urls += 1
+            if url not in self.processed_urls:
+                yield url
+
     def run(self) -> bool:
         """
         Execute indexing operation.
@@ -320,6 +1269,7 @@ class IndexingManager:
         Returns:
             bool: Operation success status
         """
+        more_remaining = False
         try:
             # 0. Load previously processed URLs
             self.load_processed_urls()
@@ -329,40 +1279,39 @@ class IndexingManager:
                 logger.error("Google API authentication failed.")
                 return False
 
-            # 2. Extract URLs from sitemap
-            urls_to_index = self.sitemap_processor.extract_urls()
-            if not urls_to_index:
+            # 2. Stream URLs from sitemap, filtering out already processed URLs
+            remaining_urls = self._iter_remaining_urls()
+
+            # 3. Apply start offset and daily limit, stopping the sitemap
+            #    parse as soon as today's URLs are collected
+            try:
+                skipped = sum(1 for _ in islice(remaining_urls, self.start_offset))
+                urls_to_process_today = list(islice(remaining_urls, self.daily_limit))
+                # Look one URL ahead to know whether work is left for later runs
+                more_remaining = next(remaining_urls, None) is not None
+            finally:
+                remaining_urls.close()
+
+            if not self.total_urls:
                 logger.error("Could not extract URLs from sitemap.")
                 return False
 
-            # 3. Filter out already processed URLs
-            remaining_urls = [
-                url for url in urls_to_index if url not in self.processed_urls
-            ]
-
-            logger.info(f"Total URLs in sitemap: {len(urls_to_index)}")
+            logger.info(f"URLs scanned in sitemap: {self.total_urls}")
             logger.info(f"Already processed: {len(self.processed_urls)}")
-            logger.info(f"Remaining to process: {len(remaining_urls)}")
 
-            if not remaining_urls:
+            if not skipped and not urls_to_process_today:
                 logger.info("All URLs have already been processed!")
                 return True
 
-            # 4. Apply start offset if specified
+            # 4. Report start offset if specified
             if self.start_offset > 0:
-                logger.info(
-                    f"Skipping first {self.start_offset} URLs from remaining list"
-                )
-                remaining_urls = remaining_urls[self.start_offset :]
-                logger.info(f"URLs after offset: {len(remaining_urls)}")
+                logger.info(f"Skipped first {skipped} URLs from remaining list")
 
-            if not remaining_urls:
+            if not urls_to_process_today:
                 logger.info("No URLs remaining after applying offset!")
                 return True
 
-            # 5. Handle daily limit - take only daily_limit URLs from remaining
-            urls_to_process_today = remaining_urls[: self.daily_limit]
-
+            # 5. Handle daily limit - only daily_limit URLs were taken from remaining
             logger.info(
                 f"Processing {len(urls_to_process_today)} URLs today (daily limit: {self.daily_limit})"
             )
@@ -370,67 +1319,69 @@ class IndexingManager:
             # 6. Display URLs to be processed today
             logger.info("URLs to be processed today (max 10 displayed):")
             for idx, url in enumerate(urls_to_process_today[:10], 1):
-                logger.info(f"{idx}. {url}")
+                logger.info("%d. %s", idx, url)
             if len(urls_to_process_today) > 10:
                 logger.info(f"... and {len(urls_to_process_today) - 10} more")
 
             # 7. Execute indexing operation
             logger.info("\nStarting index registration with Google Search Console...\n")
-            for idx, url in enumerate(urls_to_process_today, 1):
-                try:
-                    logger.info(
-                        f"[{idx}/{len(urls_to_process_today)}] Processing: {url}"
-                    )
-                    response = self.indexing_api.notify_url_updated(url)
-
-                    if "error" in response:
-                        logger.error(f"Error: {response['error']}")
-                    else:
-                        logger.info(f"Result: {response}")
-                        # Mark URL as processed only if successful
-                        self.processed_urls.add(url)
-
-                    # Delay to prevent API rate limiting
-                    time.sleep(1)
-
-                except KeyboardInterrupt:
-                    logger.warning("\nProgram interrupted by user.")
-                    break
-                except Exception as e:
-                    logger.error(f"Error occurred while processing URL: {e}")
-                    # Continue with non-fatal errors
-                    continue
+            total_today = len(urls_to_process_today)
+            # Per-URL responses are only logged at debug level
+            log_responses = logger.isEnabledFor(logging.DEBUG)
+            idx = 0
+            try:
+                for idx, (url, response) in enumerate(
+                    self.indexing_api.notify_urls_batch(urls_to_process_today), 1
+                ):
+                    if log_responses:
+                        logger.debug("Result for %s: %r", url, response)
+                    # Only successful URLs are yielded
+                    self.mark_processed(url)
+
+                    if idx % PROGRESS_LOG_INTERVAL == 0:
+                        logger.info("[%d/%d] URLs processed", idx, total_today)
+
+            except IndexingError as e:
+                logger.error(f"Indexing aborted: {e}")
+            except KeyboardInterrupt:
+                logger.warning("\nProgram interrupted by user.")
+
+            # Failed URLs are not yielded, so report the final count here
+            if not idx or idx % PROGRESS_LOG_INTERVAL:
+                logger.info("[%d/%d] URLs processed", idx, total_today)
 
             # 8. Save processed URLs to file
             self.save_processed_urls()
 
             # 9. Result summary
-            self._print_summary(len(remaining_urls))
+            self._print_summary(more_remaining)
             return True
 
         except KeyboardInterrupt:
             logger.warning("\nProgram interrupted by user.")
             self.save_processed_urls()
-            self._print_summary(
-                len(remaining_urls) if "remaining_urls" in locals() else 0
-            )
+            self._print_summary(more_remaining)
             return False
         except Exception as e:
             logger.error(f"Error occurred during operation: {e}")
             return False
+        finally:
+            self._close_journal()
+            self.indexing_api.close()
+            self.http_session.close()
 
-    def _print_summary(self, total_remaining_before_today=0):
+    def _print_summary(self, more_remaining=False):
         """Print operation result summary."""
         logger.info("\n=== Processing Result Summary ===")
         logger.info(f"URLs processed today: {self.indexing_api.success_count}")
         logger.info(f"Errors today: {self.indexing_api.error_count}")
+        for url, message in self.indexing_api.failed_urls[:10]:
+            logger.info("  - %s: %s", url, message)
+        if len(self.indexing_api.failed_urls) > 10:
+            logger.info(f"  ... and {len(self.indexing_api.failed_urls) - 10} more")
         logger.info(f"Total processed so far: {len(self.processed_urls)}")
-        if total_remaining_before_today > self.daily_limit:
-            remaining_after_today = total_remaining_before_today - self.daily_limit
-            logger.info(f"Remaining URLs to process: {remaining_after_today}")
-            logger.info(
-                f"Estimated days to complete: {(remaining_after_today + self.daily_limit - 1) // self.daily_limit}"
-            )
+        if more_remaining:
+            logger.info("More URLs remain in the sitemap for the next run.")
         logger.info("\nToday's processing completed.")
 
 
@@ -442,6 +1393,7 @@ def main():
     index_type = 1  # 1: register index, 0: delete index
     daily_limit = 200  # Daily processing limit
     start_offset = 0  # Number of URLs to skip from the beginning
+    max_workers = MAX_WORKERS  # Concurrent batch requests
 
     logger.info("=== Google Search Console Indexing Tool ===")
     logger.info(f"Sitemap URL: {sitemap_url}")
@@ -450,6 +1402,7 @@ def main():
     )
     logger.info(f"Daily limit: {daily_limit}")
     logger.info(f"Start offset: {start_offset}")
+    logger.info(f"Concurrent requests: {max_workers}")
 
     # Check client secret file
     if not os.path.exists(client_secret_file):
@@ -463,6 +1416,7 @@ def main():
         index_type=index_type,
         daily_limit=daily_limit,
         start_offset=start_offset,
+        max_workers=max_workers,
     )
 
     success = manager.run()